@@ -0,0 +1,35 @@
+from contextlib import contextmanager
+
+"""
+Thread-budget control shared by the tracking script and the registration baselines.
+
+NumPy's BLAS and Open3D's OpenMP kernels (KD-tree, FPFH, RANSAC) each default to one
+thread per core, which oversubscribes the machine when several tracking processes run at
+once. The budget caps both at the given number of threads. The scipy FFT used by the
+Poisson DCT height reconstruction defaults to a single worker, and the budget lets it use
+up to the same number of workers.
+"""
+
+
+@contextmanager
+def thread_limits(num_threads=None):
+    """
+    Limit the number of threads used by numpy, scipy FFT, and Open3D within the context.
+
+    The BLAS and OpenMP thread pools (including the one Open3D runs on) are limited with
+    threadpoolctl, and the default number of scipy.fft workers is raised to the same budget.
+    Only the libraries already loaded when the context is entered are limited. Entering the
+    context scans the loaded libraries, so enter it once around a loop rather than per call.
+
+    :param num_threads: int; the number of threads. If None, keep the library defaults.
+    """
+    if num_threads is None:
+        yield
+        return
+    if num_threads < 1:
+        raise ValueError("Number of threads must be positive, got %d" % num_threads)
+    import scipy.fft
+    from threadpoolctl import threadpool_limits
+
+    with threadpool_limits(limits=num_threads), scipy.fft.set_workers(num_threads):
+        yield
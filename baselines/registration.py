@@ -1,7 +1,10 @@
+import functools
+
 import numpy as np
 import open3d as o3d
-import probreg
 
+from baselines.parallel import thread_limits
+from baselines.sensor_profile import registration_params
 from normalflow.utils import height2pointcloud
 
 """
@@ -25,6 +28,7 @@ def fpfh(
     tar_T_ref_init=np.eye(4),
     ppmm=0.0634,
     n_samples=None,
+    num_threads=None,
 ):
     """
     The FPFH based algorithm to estimate the homogeneous transformation of the sensor between two frames.
@@ -45,84 +49,111 @@ def fpfh(
     :param tar_T_ref_init: np.2darray (4, 4); the initial guess homogeneous transformation matrix.
     :param ppmm: float; pixel per millimeter.
     :param n_samples: int; the number of samples to use for the optimization. If None, use all the pixels in contact.
+    :param num_threads: int; the number of threads for numpy and Open3D. If None, use the current limits.
+        Limiting per call rescans the loaded libraries, so loops should rather wrap thread_limits around them.
     :return: np.ndarray (4, 4); the homogeneous transformation matrix from frame t to frame t+1.
     """
-    # FPFH feature extraction in the reference frame
-    masked_N_ref = N_ref.reshape(-1, 3)[C_ref.reshape(-1)]
-    if n_samples is not None and n_samples < masked_N_ref.shape[0]:
-        # Randomly sample the points to speed up
-        sample_mask_ref = np.random.choice(
-            masked_N_ref.shape[0], n_samples, replace=False
+    params = registration_params(ppmm)
+    with thread_limits(num_threads):
+        # FPFH feature extraction in the reference frame
+        masked_N_ref = N_ref.reshape(-1, 3)[C_ref.reshape(-1)]
+        if n_samples is not None and n_samples < masked_N_ref.shape[0]:
+            # Randomly sample the points to speed up
+            sample_mask_ref = np.random.choice(
+                masked_N_ref.shape[0], n_samples, replace=False
+            )
+        else:
+            sample_mask_ref = np.arange(masked_N_ref.shape[0])
+        pointcloud_ref = height2pointcloud(H_ref, ppmm)
+        masked_pointcloud_ref = pointcloud_ref[C_ref.reshape(-1)]
+        pcd_ref = o3d.geometry.PointCloud()
+        pcd_ref.points = o3d.utility.Vector3dVector(
+            masked_pointcloud_ref[sample_mask_ref]
+        )
+        pcd_ref.normals = o3d.utility.Vector3dVector(masked_N_ref[sample_mask_ref])
+        pcd_ref = _downsample(pcd_ref, params["voxel_size"])
+        fpfh_ref = o3d.pipelines.registration.compute_fpfh_feature(
+            pcd_ref,
+            o3d.geometry.KDTreeSearchParamHybrid(
+                radius=params["fpfh_radius"], max_nn=params["fpfh_max_nn"]
+            ),
         )
-    else:
-        sample_mask_ref = np.arange(masked_N_ref.shape[0])
-    pointcloud_ref = height2pointcloud(H_ref, ppmm)
-    masked_pointcloud_ref = pointcloud_ref[C_ref.reshape(-1)]
-    pcd_ref = o3d.geometry.PointCloud()
-    pcd_ref.points = o3d.utility.Vector3dVector(masked_pointcloud_ref[sample_mask_ref])
-    pcd_ref.normals = o3d.utility.Vector3dVector(masked_N_ref[sample_mask_ref])
-    fpfh_ref = o3d.pipelines.registration.compute_fpfh_feature(
-        pcd_ref, o3d.geometry.KDTreeSearchParamHybrid(radius=0.001, max_nn=100)
-    )
 
-    # FPFH feature extraction in the target frame
-    ref_T_tar_init = np.linalg.inv(tar_T_ref_init)
-    masked_N_tar = N_tar.reshape(-1, 3)[C_tar.reshape(-1)]
-    masked_N_tar = np.dot(ref_T_tar_init[:3, :3], masked_N_tar.T).T
-    if n_samples is not None and n_samples < masked_N_tar.shape[0]:
-        # Randomly sample the points to speed up
-        sample_mask_tar = np.random.choice(
-            masked_N_tar.shape[0], n_samples, replace=False
+        # FPFH feature extraction in the target frame
+        ref_T_tar_init = np.linalg.inv(tar_T_ref_init)
+        masked_N_tar = N_tar.reshape(-1, 3)[C_tar.reshape(-1)]
+        masked_N_tar = np.dot(ref_T_tar_init[:3, :3], masked_N_tar.T).T
+        if n_samples is not None and n_samples < masked_N_tar.shape[0]:
+            # Randomly sample the points to speed up
+            sample_mask_tar = np.random.choice(
+                masked_N_tar.shape[0], n_samples, replace=False
+            )
+        else:
+            sample_mask_tar = np.arange(masked_N_tar.shape[0])
+        pointcloud_tar = height2pointcloud(H_tar, ppmm)
+        masked_pointcloud_tar = pointcloud_tar[C_tar.reshape(-1)]
+        masked_pointcloud_tar = (
+            np.dot(ref_T_tar_init[:3, :3], masked_pointcloud_tar.T).T
+            + ref_T_tar_init[:3, 3]
+        )
+        pcd_tar = o3d.geometry.PointCloud()
+        pcd_tar.points = o3d.utility.Vector3dVector(
+            masked_pointcloud_tar[sample_mask_tar]
+        )
+        pcd_tar.normals = o3d.utility.Vector3dVector(masked_N_tar[sample_mask_tar])
+        pcd_tar = _downsample(pcd_tar, params["voxel_size"])
+        fpfh_tar = o3d.pipelines.registration.compute_fpfh_feature(
+            pcd_tar,
+            o3d.geometry.KDTreeSearchParamHybrid(
+                radius=params["fpfh_radius"], max_nn=params["fpfh_max_nn"]
+            ),
         )
-    else:
-        sample_mask_tar = np.arange(masked_N_tar.shape[0])
-    pointcloud_tar = height2pointcloud(H_tar, ppmm)
-    masked_pointcloud_tar = pointcloud_tar[C_tar.reshape(-1)]
-    masked_pointcloud_tar = (
-        np.dot(ref_T_tar_init[:3, :3], masked_pointcloud_tar.T).T
-        + ref_T_tar_init[:3, 3]
-    )
-    pcd_tar = o3d.geometry.PointCloud()
-    pcd_tar.points = o3d.utility.Vector3dVector(masked_pointcloud_tar[sample_mask_tar])
-    pcd_tar.normals = o3d.utility.Vector3dVector(masked_N_tar[sample_mask_tar])
-    fpfh_tar = o3d.pipelines.registration.compute_fpfh_feature(
-        pcd_tar, o3d.geometry.KDTreeSearchParamHybrid(radius=0.001, max_nn=100)
-    )
 
-    # Matching the FPFH features using RANSAC
-    result = o3d.pipelines.registration.registration_ransac_based_on_feature_matching(
-        pcd_ref,
-        pcd_tar,
-        fpfh_ref,
-        fpfh_tar,
-        True,
-        0.001,
-        o3d.pipelines.registration.TransformationEstimationPointToPoint(),
-        ransac_n=4,
-        checkers=[
-            o3d.pipelines.registration.CorrespondenceCheckerBasedOnEdgeLength(0.9),
-            o3d.pipelines.registration.CorrespondenceCheckerBasedOnDistance(0.001),
-        ],
-        criteria=o3d.pipelines.registration.RANSACConvergenceCriteria(10000, 0.99),
-    )
-    T = result.transformation
-    tar_T_ref_fpfh = np.dot(tar_T_ref_init, T)
-
-    # Apply point-to-plane ICP to fine-tune the transformation
-    masked_N_tar = N_tar.reshape(-1, 3)[C_tar.reshape(-1)]
-    masked_pointcloud_tar = pointcloud_tar[C_tar.reshape(-1)]
-    pcd_tar = o3d.geometry.PointCloud()
-    pcd_tar.points = o3d.utility.Vector3dVector(masked_pointcloud_tar[sample_mask_tar])
-    pcd_tar.normals = o3d.utility.Vector3dVector(masked_N_tar[sample_mask_tar])
-    reg_p2p = o3d.pipelines.registration.registration_icp(
-        pcd_ref,
-        pcd_tar,
-        0.1,
-        tar_T_ref_fpfh,
-        o3d.pipelines.registration.TransformationEstimationPointToPlane(),
-    )
-    tar_T_ref = reg_p2p.transformation
-    return tar_T_ref
+        # Matching the FPFH features using RANSAC
+        result = (
+            o3d.pipelines.registration.registration_ransac_based_on_feature_matching(
+                pcd_ref,
+                pcd_tar,
+                fpfh_ref,
+                fpfh_tar,
+                True,
+                params["ransac_distance"],
+                o3d.pipelines.registration.TransformationEstimationPointToPoint(),
+                ransac_n=4,
+                checkers=[
+                    o3d.pipelines.registration.CorrespondenceCheckerBasedOnEdgeLength(
+                        0.9
+                    ),
+                    o3d.pipelines.registration.CorrespondenceCheckerBasedOnDistance(
+                        params["ransac_distance"]
+                    ),
+                ],
+                criteria=o3d.pipelines.registration.RANSACConvergenceCriteria(
+                    10000, 0.99
+                ),
+            )
+        )
+        T = result.transformation
+        tar_T_ref_fpfh = np.dot(tar_T_ref_init, T)
+
+        # Apply point-to-plane ICP to fine-tune the transformation
+        masked_N_tar = N_tar.reshape(-1, 3)[C_tar.reshape(-1)]
+        masked_pointcloud_tar = pointcloud_tar[C_tar.reshape(-1)]
+        pcd_tar = o3d.geometry.PointCloud()
+        pcd_tar.points = o3d.utility.Vector3dVector(
+            masked_pointcloud_tar[sample_mask_tar]
+        )
+        pcd_tar.normals = o3d.utility.Vector3dVector(masked_N_tar[sample_mask_tar])
+        pcd_tar = _downsample(pcd_tar, params["voxel_size"])
+        reg_p2p = o3d.pipelines.registration.registration_icp(
+            pcd_ref,
+            pcd_tar,
+            params["icp_distance"],
+            tar_T_ref_fpfh,
+            o3d.pipelines.registration.TransformationEstimationPointToPlane(),
+        )
+        tar_T_ref = reg_p2p.transformation
+        return tar_T_ref
 
 
 def icp(
@@ -135,6 +166,8 @@ def icp(
     tar_T_ref_init=np.eye(4),
     ppmm=0.0634,
     n_samples=None,
+    num_threads=None,
+    dtype=np.float64,
 ):
     """
     Using point-to-plane ICP to estimate the homogeneous transformation of the sensor between two frames.
@@ -151,47 +184,63 @@ def icp(
     :param tar_T_ref_init: np.2darray (4, 4); the initial guess homogeneous transformation matrix.
     :param ppmm: float; pixel per millimeter.
     :param n_samples: int; the number of samples to use for the optimization. If None, use all the pixels in contact.
+    :param num_threads: int; the number of threads for numpy and Open3D. If None, use the current limits.
+        Limiting per call rescans the loaded libraries, so loops should rather wrap thread_limits around them.
+    :param dtype: np.dtype; the precision of the point clouds and normals. With np.float32, the point clouds
+        are built in float32 and registered with the Open3D tensor API. The transformations stay in float64.
     :return: np.ndarray (4, 4); the homogeneous transformation matrix from frame t to frame t+1.
     """
-    # Pointcloud of the reference frame
-    masked_N_ref = N_ref.reshape(-1, 3)[C_ref.reshape(-1)]
-    if n_samples is not None and n_samples < masked_N_ref.shape[0]:
-        # Randomly sample the points to speed up
-        sample_mask_ref = np.random.choice(
-            masked_N_ref.shape[0], n_samples, replace=False
+    params = registration_params(ppmm)
+    with thread_limits(num_threads):
+        # Pointcloud of the reference frame
+        masked_N_ref = N_ref.reshape(-1, 3)[C_ref.reshape(-1)]
+        if n_samples is not None and n_samples < masked_N_ref.shape[0]:
+            # Randomly sample the points to speed up
+            sample_mask_ref = np.random.choice(
+                masked_N_ref.shape[0], n_samples, replace=False
+            )
+        else:
+            sample_mask_ref = np.arange(masked_N_ref.shape[0])
+        masked_pointcloud_ref = _masked_pointcloud(H_ref, C_ref, ppmm, dtype)
+        pcd_ref = _pointcloud(
+            masked_pointcloud_ref[sample_mask_ref], masked_N_ref[sample_mask_ref], dtype
         )
-    else:
-        sample_mask_ref = np.arange(masked_N_ref.shape[0])
-    pointcloud_ref = height2pointcloud(H_ref, ppmm)
-    masked_pointcloud_ref = pointcloud_ref[C_ref.reshape(-1)]
-    pcd_ref = o3d.geometry.PointCloud()
-    pcd_ref.points = o3d.utility.Vector3dVector(masked_pointcloud_ref[sample_mask_ref])
-    pcd_ref.normals = o3d.utility.Vector3dVector(masked_N_ref[sample_mask_ref])
-    # Pointcloud of the target frame
-    masked_N_tar = N_tar.reshape(-1, 3)[C_tar.reshape(-1)]
-    if n_samples is not None and n_samples < masked_N_tar.shape[0]:
-        # Randomly sample the points to speed up
-        sample_mask_tar = np.random.choice(
-            masked_N_tar.shape[0], n_samples, replace=False
+        pcd_ref = _downsample(pcd_ref, params["voxel_size"])
+        # Pointcloud of the target frame
+        masked_N_tar = N_tar.reshape(-1, 3)[C_tar.reshape(-1)]
+        if n_samples is not None and n_samples < masked_N_tar.shape[0]:
+            # Randomly sample the points to speed up
+            sample_mask_tar = np.random.choice(
+                masked_N_tar.shape[0], n_samples, replace=False
+            )
+        else:
+            sample_mask_tar = np.arange(masked_N_tar.shape[0])
+        masked_pointcloud_tar = _masked_pointcloud(H_tar, C_tar, ppmm, dtype)
+        pcd_tar = _pointcloud(
+            masked_pointcloud_tar[sample_mask_tar], masked_N_tar[sample_mask_tar], dtype
         )
-    else:
-        sample_mask_tar = np.arange(masked_N_tar.shape[0])
-    pointcloud_tar = height2pointcloud(H_tar, ppmm)
-    masked_pointcloud_tar = pointcloud_tar[C_tar.reshape(-1)]
-    pcd_tar = o3d.geometry.PointCloud()
-    pcd_tar.points = o3d.utility.Vector3dVector(masked_pointcloud_tar[sample_mask_tar])
-    pcd_tar.normals = o3d.utility.Vector3dVector(masked_N_tar[sample_mask_tar])
-
-    # Apply point-to-plane ICP
-    reg_p2p = o3d.pipelines.registration.registration_icp(
-        pcd_ref,
-        pcd_tar,
-        0.1,
-        tar_T_ref_init,
-        o3d.pipelines.registration.TransformationEstimationPointToPlane(),
-    )
-    tar_T_ref = reg_p2p.transformation
-    return tar_T_ref
+        pcd_tar = _downsample(pcd_tar, params["voxel_size"])
+
+        # Apply point-to-plane ICP
+        if dtype == np.float64:
+            reg_p2p = o3d.pipelines.registration.registration_icp(
+                pcd_ref,
+                pcd_tar,
+                params["icp_distance"],
+                tar_T_ref_init,
+                o3d.pipelines.registration.TransformationEstimationPointToPlane(),
+            )
+            tar_T_ref = reg_p2p.transformation
+        else:
+            reg_p2p = o3d.t.pipelines.registration.icp(
+                pcd_ref,
+                pcd_tar,
+                params["icp_distance"],
+                o3d.core.Tensor(tar_T_ref_init),
+                o3d.t.pipelines.registration.TransformationEstimationPointToPlane(),
+            )
+            tar_T_ref = reg_p2p.transformation.numpy()
+        return tar_T_ref
 
 
 def filterreg(
@@ -203,6 +252,7 @@ def filterreg(
     tar_T_ref_init=np.eye(4),
     ppmm=0.0634,
     n_samples=None,
+    num_threads=None,
 ):
     """
     Using FilterReg registration to estimate the homogeneous transformation of the sensor between two frames.
@@ -221,48 +271,143 @@ def filterreg(
     :param tar_T_ref_init: np.2darray (4, 4); the initial guess homogeneous transformation matrix.
     :param ppmm: float; pixel per millimeter.
     :param n_samples: int; the number of samples to use for the optimization. If None, use all the pixels in contact.
+    :param num_threads: int; the number of threads for numpy and Open3D. If None, use the current limits.
+        Limiting per call rescans the loaded libraries, so loops should rather wrap thread_limits around them.
     :return: np.ndarray (4, 4); the homogeneous transformation matrix from frame t to frame t+1.
     """
-    # Pointcloud of the reference frame in mm for better performance
-    pointcloud_ref = height2pointcloud(H_ref, ppmm) * 1000.0
-    masked_pointcloud_ref = pointcloud_ref[C_ref.reshape(-1)]
-    if n_samples is not None and n_samples < masked_pointcloud_ref.shape[0]:
-        # Randomly sample the points to speed up
-        sample_mask_ref = np.random.choice(
-            masked_pointcloud_ref.shape[0], n_samples, replace=False
+    # probreg is only needed by FilterReg, so it is imported on first use
+    import probreg
+
+    params = registration_params(ppmm)
+    with thread_limits(num_threads):
+        # Pointcloud of the reference frame in mm for better performance
+        pointcloud_ref = height2pointcloud(H_ref, ppmm)
+        masked_pointcloud_ref = pointcloud_ref[C_ref.reshape(-1)] * 1000.0
+        if n_samples is not None and n_samples < masked_pointcloud_ref.shape[0]:
+            # Randomly sample the points to speed up
+            sample_mask_ref = np.random.choice(
+                masked_pointcloud_ref.shape[0], n_samples, replace=False
+            )
+        else:
+            sample_mask_ref = np.arange(masked_pointcloud_ref.shape[0])
+        pcd_ref = o3d.geometry.PointCloud()
+        pcd_ref.points = o3d.utility.Vector3dVector(
+            masked_pointcloud_ref[sample_mask_ref]
         )
-    else:
-        sample_mask_ref = np.arange(masked_pointcloud_ref.shape[0])
-    pcd_ref = o3d.geometry.PointCloud()
-    pcd_ref.points = o3d.utility.Vector3dVector(masked_pointcloud_ref[sample_mask_ref])
-    # Pointcloud of the target frame
-    masked_N_tar = N_tar.reshape(-1, 3)[C_tar.reshape(-1)]
-    if n_samples is not None and n_samples < masked_N_tar.shape[0]:
-        # Randomly sample the points to speed up
-        sample_mask_tar = np.random.choice(
-            masked_N_tar.shape[0], n_samples, replace=False
+        if params["voxel_size"] is not None:
+            pcd_ref = _downsample(pcd_ref, params["voxel_size"] * 1000.0)
+        # Pointcloud of the target frame
+        masked_N_tar = N_tar.reshape(-1, 3)[C_tar.reshape(-1)]
+        if n_samples is not None and n_samples < masked_N_tar.shape[0]:
+            # Randomly sample the points to speed up
+            sample_mask_tar = np.random.choice(
+                masked_N_tar.shape[0], n_samples, replace=False
+            )
+        else:
+            sample_mask_tar = np.arange(masked_N_tar.shape[0])
+        pointcloud_tar = height2pointcloud(H_tar, ppmm)
+        masked_pointcloud_tar = pointcloud_tar[C_tar.reshape(-1)] * 1000.0
+        pcd_tar = o3d.geometry.PointCloud()
+        pcd_tar.points = o3d.utility.Vector3dVector(
+            masked_pointcloud_tar[sample_mask_tar]
         )
-    else:
-        sample_mask_tar = np.arange(masked_N_tar.shape[0])
-    pointcloud_tar = height2pointcloud(H_tar, ppmm) * 1000.0
-    masked_pointcloud_tar = pointcloud_tar[C_tar.reshape(-1)]
-    pcd_tar = o3d.geometry.PointCloud()
-    pcd_tar.points = o3d.utility.Vector3dVector(masked_pointcloud_tar[sample_mask_tar])
-
-    # Apply point-to-plane FilterReg
-    reg_p2p = probreg.filterreg.registration_filterreg(
-        pcd_ref,
-        pcd_tar,
-        masked_N_tar[sample_mask_tar],
-        tol=1e-5,
-        sigma2=0.01,
-        objective_type="pt2pl",
-        tf_init_params={
-            "rot": tar_T_ref_init[:3, :3],
-            "t": tar_T_ref_init[:3, 3] * 1000.0,
-        },
+        normals_tar = masked_N_tar[sample_mask_tar]
+        if params["voxel_size"] is not None:
+            # Downsample the normals together with the points
+            pcd_tar.normals = o3d.utility.Vector3dVector(normals_tar)
+            pcd_tar = _downsample(pcd_tar, params["voxel_size"] * 1000.0)
+            normals_tar = np.asarray(pcd_tar.normals)
+
+        # Apply point-to-plane FilterReg
+        reg_p2p = probreg.filterreg.registration_filterreg(
+            pcd_ref,
+            pcd_tar,
+            normals_tar,
+            tol=1e-5,
+            sigma2=params["filterreg_sigma2"],
+            objective_type="pt2pl",
+            tf_init_params={
+                "rot": tar_T_ref_init[:3, :3],
+                "t": tar_T_ref_init[:3, 3] * 1000.0,
+            },
+        )
+        tar_T_ref = np.eye(4)
+        tar_T_ref[:3, :3] = reg_p2p.transformation.rot
+        tar_T_ref[:3, 3] = reg_p2p.transformation.t / 1000.0
+        return tar_T_ref
+
+
+def _downsample(pcd, voxel_size):
+    """
+    Voxel downsample the pointcloud so its density matches the tuned registration parameters.
+
+    :param pcd: o3d.geometry.PointCloud or o3d.t.geometry.PointCloud; the pointcloud.
+    :param voxel_size: float; the voxel size. If None, return the pointcloud unchanged.
+    :return: o3d.geometry.PointCloud or o3d.t.geometry.PointCloud; the downsampled pointcloud.
+    """
+    if voxel_size is None:
+        return pcd
+    return pcd.voxel_down_sample(voxel_size)
+
+
+def _masked_pointcloud(H, C, ppmm, dtype=np.float64):
+    """
+    Convert the height map to the pointcloud of the pixels in contact.
+
+    With np.float64, this is height2pointcloud followed by the contact mask. With np.float32,
+    only the pixels in contact are converted, directly in float32, so no full float64
+    pointcloud is built.
+
+    :param H: np.ndarray (H, W); the height map. (unit: pixel)
+    :param C: np.ndarray (H, W); the contact map.
+    :param ppmm: float; pixel per millimeter.
+    :param dtype: np.dtype; the precision of the pointcloud.
+    :return: np.ndarray (N, 3); the pointcloud of the pixels in contact. (unit: m)
+    """
+    mask = C.reshape(-1)
+    if dtype == np.float64:
+        return height2pointcloud(H, ppmm)[mask]
+    grid, height_scale = _pointcloud_grid(H.shape[0], H.shape[1], ppmm, dtype)
+    pointcloud = np.empty((np.count_nonzero(mask), 3), dtype=dtype)
+    pointcloud[:, :2] = grid[mask]
+    pointcloud[:, 2] = H.reshape(-1)[mask]
+    pointcloud[:, 2] *= height_scale
+    return pointcloud
+
+
+@functools.lru_cache(maxsize=8)
+def _pointcloud_grid(imgh, imgw, ppmm, dtype):
+    """
+    The pixel coordinates and the height scale that height2pointcloud uses, in the given precision.
+
+    :param imgh: int; the height of the image.
+    :param imgw: int; the width of the image.
+    :param ppmm: float; pixel per millimeter.
+    :param dtype: np.dtype; the precision of the coordinates.
+    :return: tuple; the (H * W, 2) pixel coordinates (unit: m) and the height scale (unit: m/pixel).
+    """
+    pointcloud_zero = height2pointcloud(np.zeros((imgh, imgw), dtype=np.float32), ppmm)
+    pointcloud_one = height2pointcloud(np.ones((imgh, imgw), dtype=np.float32), ppmm)
+    height_scale = pointcloud_one[0, 2] - pointcloud_zero[0, 2]
+    return pointcloud_zero[:, :2].astype(dtype), height_scale
+
+
+def _pointcloud(points, normals, dtype=np.float64):
+    """
+    Create the Open3D pointcloud, a legacy one for np.float64 and a tensor one otherwise.
+
+    :param points: np.ndarray (N, 3); the points.
+    :param normals: np.ndarray (N, 3); the normals.
+    :param dtype: np.dtype; the precision of the pointcloud.
+    :return: o3d.geometry.PointCloud or o3d.t.geometry.PointCloud; the pointcloud.
+    """
+    if dtype == np.float64:
+        pcd = o3d.geometry.PointCloud()
+        pcd.points = o3d.utility.Vector3dVector(points)
+        pcd.normals = o3d.utility.Vector3dVector(normals)
+        return pcd
+    pcd = o3d.t.geometry.PointCloud(
+        o3d.core.Tensor(np.ascontiguousarray(points, dtype))
     )
-    tar_T_ref = np.eye(4)
-    tar_T_ref[:3, :3] = reg_p2p.transformation.rot
-    tar_T_ref[:3, 3] = reg_p2p.transformation.t / 1000.0
-    return tar_T_ref
+    pcd.point.normals = o3d.core.Tensor(np.ascontiguousarray(normals, dtype))
+    return pcd
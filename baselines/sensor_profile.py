@@ -0,0 +1,107 @@
+import numpy as np
+import yaml
+
+"""
+Sensor profiles and the resolution-aware parameters of the registration baselines.
+
+The spatial constants of the baselines were tuned for the GelSight Mini at 320x240, where
+one pixel spans REFERENCE_PPMM millimeters. Sensors with a finer pixel pitch produce many
+more points per square millimeter, so the point clouds are voxel downsampled back to the
+reference pitch. Sensors with a coarser pitch keep all points and scale the spatial
+constants with the pitch so that neighbourhoods hold about the same number of points.
+"""
+
+# The pixel pitch the registration constants are tuned for (GelSight Mini, 320x240)
+REFERENCE_PPMM = 0.0634
+# Keys every sensor profile has to define
+REQUIRED_KEYS = ("device_name", "ppmm", "imgh", "imgw")
+
+
+def load_sensor_profile(config_path):
+    """
+    Load the sensor profile from a configuration file.
+
+    :param config_path: str; the path of the configuration file.
+    :return: dict; the sensor profile with the optional keys filled by their defaults.
+    """
+    with open(config_path, "r") as f:
+        config = yaml.safe_load(f)
+    missing_keys = [key for key in REQUIRED_KEYS if key not in config]
+    if len(missing_keys) > 0:
+        raise ValueError(
+            "Sensor configuration %s misses keys: %s"
+            % (config_path, ", ".join(missing_keys))
+        )
+    config.setdefault("threads", None)
+    config.setdefault("downscale", 1)
+    return config
+
+
+def check_frame_size(gradient_maps, imgh, imgw):
+    """
+    Check that the frames have the resolution of the sensor profile, since its ppmm and the
+    registration parameters derived from it only hold at that resolution.
+
+    :param gradient_maps: np.ndarray (N, H, W, 2); the gradient maps of the frames.
+    :param imgh: int; the image height of the sensor profile.
+    :param imgw: int; the image width of the sensor profile.
+    """
+    if gradient_maps.shape[1:3] != (imgh, imgw):
+        raise ValueError(
+            "Frames of size %dx%d do not match the %dx%d sensor profile"
+            % (gradient_maps.shape[2], gradient_maps.shape[1], imgw, imgh)
+        )
+
+
+def registration_params(ppmm=REFERENCE_PPMM):
+    """
+    Derive the spatial parameters of the registration baselines from the pixel pitch.
+
+    :param ppmm: float; pixel per millimeter.
+    :return: dict; the registration parameters (unit: meter, except filterreg_sigma2 in mm^2).
+        voxel_size is None when the point clouds do not need downsampling.
+    """
+    # Ratio of the point cloud pitch after downsampling to the reference pitch
+    scale = max(ppmm / REFERENCE_PPMM, 1.0)
+    return {
+        "voxel_size": None if ppmm >= REFERENCE_PPMM else REFERENCE_PPMM / 1000.0,
+        "fpfh_radius": 0.001 * scale,
+        "fpfh_max_nn": 100,
+        "ransac_distance": 0.001 * scale,
+        "icp_distance": 0.1,
+        "filterreg_sigma2": 0.01 * scale**2,
+    }
+
+
+def downscale(gradient_maps, contact_masks, ppmm, factor):
+    """
+    Downscale the gradient maps and contact masks by an integer factor.
+
+    The gradients are averaged over factor x factor blocks, which keeps them consistent
+    because the height is measured in pixels. A pixel is in contact if most of its block is.
+    The trailing rows and columns that do not fill a block are cropped.
+
+    :param gradient_maps: np.ndarray (N, H, W, 2); the gradient maps of the frames.
+    :param contact_masks: np.ndarray (N, H, W); the contact masks of the frames.
+    :param ppmm: float; pixel per millimeter.
+    :param factor: int; the downscale factor.
+    :return: tuple; the downscaled gradient maps, contact masks, and the new ppmm.
+    """
+    if factor == 1:
+        return gradient_maps, contact_masks, ppmm
+    if factor < 1:
+        raise ValueError("Downscale factor must be positive, got %d" % factor)
+    n_frames, imgh, imgw = contact_masks.shape
+    imgh, imgw = imgh // factor * factor, imgw // factor * factor
+    gradient_maps = (
+        gradient_maps[:, :imgh, :imgw]
+        .reshape(n_frames, imgh // factor, factor, imgw // factor, factor, 2)
+        .mean(axis=(2, 4), dtype=np.float32)
+    )
+    contact_masks = (
+        contact_masks[:, :imgh, :imgw]
+        .reshape(n_frames, imgh // factor, factor, imgw // factor, factor)
+        .mean(axis=(2, 4))
+        > 0.5
+    )
+    return gradient_maps, contact_masks, ppmm * factor
@@ -0,0 +1,64 @@
+#!/bin/bash
+
+# This script benchmarks the import time of the command line entry points with python -X importtime.
+# It also reports the heavy modules each entry point loads before parsing its arguments,
+# and fails if an entry point exceeds the import time budget or loads a heavy module.
+
+# Usage function to display help
+usage() {
+    echo "Usage: $0 [-b budget_ms]"
+    exit 1
+}
+
+# Parse command-line arguments
+budget_ms=500
+while getopts ":b:" opt; do
+    case ${opt} in
+    b)
+        budget_ms=$OPTARG
+        ;;
+    \?)
+        usage
+        ;;
+    esac
+done
+shift $((OPTIND - 1))
+
+# Import the entry points from the repository root
+script_dir=$(dirname "$(realpath "$0")")
+cd "${script_dir}/.." || exit 1
+export PYTHONPATH="${PWD}${PYTHONPATH:+:${PYTHONPATH}}"
+entry_points=(
+    track.track
+    track.check_precision
+    track.server
+    track.client
+    visualization.viz_track
+    visualization.viz_track_result
+)
+heavy_modules="open3d|probreg|cv2|matplotlib|gs_sdk|normalflow"
+
+# Measure the total import time of each entry point
+failed=0
+log=$(mktemp)
+trap 'rm -f "${log}"' EXIT
+printf "%-32s %12s   %s\n" "entry point" "import (ms)" "heavy modules"
+for entry_point in "${entry_points[@]}"; do
+    if ! python -X importtime -c "import ${entry_point}" 2>"${log}"; then
+        echo "Failed to import ${entry_point}:"
+        cat "${log}"
+        failed=1
+        continue
+    fi
+    # Sum the cumulative time of the top-level imports (unit: us)
+    import_ms=$(awk -F'|' '$3 ~ /^ [^ ]/ { total += $2 } END { printf "%.1f", total / 1000 }' "${log}")
+    loaded=$(awk -F'|' '{ gsub(/ /, "", $3); print $3 }' "${log}" | grep -E "^(${heavy_modules})$" | tr '\n' ' ')
+    printf "%-32s %12s   %s\n" "${entry_point}" "${import_ms}" "${loaded:--}"
+    if [ -n "${loaded}" ] || awk -v t="${import_ms}" -v b="${budget_ms}" 'BEGIN { exit !(t > b) }'; then
+        failed=1
+    fi
+done
+if [ "${failed}" -ne 0 ]; then
+    echo "Some entry points exceed the ${budget_ms} ms import budget or load heavy modules"
+    exit 1
+fi
@@ -0,0 +1,84 @@
+#!/bin/bash
+
+# This script benchmarks the tracking throughput for different processes x threads splits.
+# For every split, it runs the given number of concurrent track processes on copies of one
+# trial, each limited to the given number of threads, and reports the trials per second.
+
+# Usage function to display help
+usage() {
+    echo "Usage: $0 [-p trial_dir] [-m {nf|icp|filterreg|fpfh}] [-n total_threads]"
+    exit 1
+}
+
+# Parse command-line arguments
+method=nf
+total_threads=$(nproc)
+while getopts ":p:m:n:" opt; do
+    case ${opt} in
+    p)
+        trial_dir=$OPTARG
+        ;;
+    m)
+        case $OPTARG in
+        nf | icp | filterreg | fpfh)
+            method=$OPTARG
+            ;;
+        *)
+            echo "Invalid value for -m. Allowed values are: nf, icp, filterreg, fpfh"
+            usage
+            ;;
+        esac
+        ;;
+    n)
+        total_threads=$OPTARG
+        ;;
+    \?)
+        usage
+        ;;
+    esac
+done
+shift $((OPTIND - 1))
+if [ -z "${trial_dir}" ]; then
+    usage
+fi
+
+# Get the configuration directories
+script_dir=$(dirname "$(realpath "$0")")
+gsmini_config_dir=$(realpath "${script_dir}/../configs/gsmini.yaml")
+
+# Copy the trial once per process so that concurrent runs do not share output files
+work_dir=$(mktemp -d)
+trap 'rm -rf "${work_dir}"' EXIT
+for ((i = 0; i < total_threads; i++)); do
+    mkdir -p "${work_dir}/trial${i}"
+    cp "${trial_dir}/gradient_maps.npy" "${trial_dir}/contact_masks.npy" "${work_dir}/trial${i}"
+done
+
+# Benchmark every split whose processes x threads equals the total thread budget
+printf "%10s %10s %12s %14s\n" "processes" "threads" "time (s)" "trials/s"
+for ((threads = 1; threads <= total_threads; threads++)); do
+    if ((total_threads % threads != 0)); then
+        continue
+    fi
+    processes=$((total_threads / threads))
+    start=$(date +%s.%N)
+    pids=()
+    for ((i = 0; i < processes; i++)); do
+        track -p "${work_dir}/trial${i}" -c "${gsmini_config_dir}" -m "${method}" -t "${threads}" >/dev/null &
+        pids+=($!)
+    done
+    # Abort instead of reporting the throughput of failed runs
+    failed=0
+    for pid in "${pids[@]}"; do
+        if ! wait "${pid}"; then
+            failed=1
+        fi
+    done
+    if ((failed)); then
+        echo "A track run failed with ${processes} processes x ${threads} threads" >&2
+        exit 1
+    fi
+    end=$(date +%s.%N)
+    awk -v p="${processes}" -v t="${threads}" -v s="${start}" -v e="${end}" \
+        'BEGIN { printf "%10d %10d %12.2f %14.3f\n", p, t, e - s, p / (e - s) }'
+done
@@ -10,11 +10,16 @@ setup(
     install_requires=[
         "open3d>=0.16.0",
         "probreg",
+        "pyyaml",
+        "threadpoolctl",
     ],
     python_requires=">=3.8",
     entry_points={
         'console_scripts': [
             'track=track.track:track',
+            'check_precision=track.check_precision:check_precision',
+            'track_server=track.server:track_server',
+            'track_client=track.client:track_client',
             'viz_track_result=visualization.viz_track_result:viz_track_result',
             'viz_track=visualization.viz_track:viz_track',
         ],
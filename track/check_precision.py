@@ -0,0 +1,122 @@
+import argparse
+import os
+
+import numpy as np
+
+from baselines.sensor_profile import check_frame_size, downscale, load_sensor_profile
+from track.track import track_poses
+
+"""
+This script checks the accuracy drift of the float32 ICP tracking against the float64 one.
+It tracks a trial in both precisions and compares the estimated poses frame by frame.
+ICP is the only method whose point clouds are built and registered in float32.
+
+Usage:
+    python check_precision.py [--parent_dir PARENT_DIR] [--config_path CONFIG_PATH] [--method METHOD {icp}]
+
+Arguments:
+    --parent_dir: The directory where the data are stored.
+    --config_path: (Optional) The path of the configuration file for the GelSight sensor.
+            The configuration file specifies the specifications of the sensor.
+            The default is GelSight Mini configuration.
+    --method: (Optional) The method to track the object poses. The default is 'icp'.
+    --trans_tol: (Optional) The tolerated translation drift in mm. The default is 0.01.
+    --rot_tol: (Optional) The tolerated rotation drift in degrees. The default is 0.1.
+
+Before running, the required dataset needs to have:
+    - contact_masks.npy: The contact masks of the frames.
+    - gradient_maps.npy: The gradient maps of the frames.
+
+The script exits with an error if the drift exceeds the tolerances. No files are written.
+"""
+
+config_path = os.path.join(os.path.dirname(__file__), "../configs/gsmini.yaml")
+
+
+def check_precision():
+    # Argument Parser
+    parser = argparse.ArgumentParser(
+        description="Check the float32 tracking drift against float64."
+    )
+    parser.add_argument(
+        "-p",
+        "--parent_dir",
+        type=str,
+        help="path to save data",
+    )
+    parser.add_argument(
+        "-c",
+        "--config_path",
+        type=str,
+        default=config_path,
+        help="path to the sensor configuration file",
+    )
+    parser.add_argument(
+        "-m",
+        "--method",
+        type=str,
+        default="icp",
+        choices=["icp"],
+        help="Registration method",
+    )
+    parser.add_argument(
+        "--trans_tol",
+        type=float,
+        default=0.01,
+        help="tolerated translation drift (unit: mm)",
+    )
+    parser.add_argument(
+        "--rot_tol",
+        type=float,
+        default=0.1,
+        help="tolerated rotation drift (unit: degree)",
+    )
+    args = parser.parse_args()
+    # Import Open3D after parsing the arguments to keep the start-up fast
+    import open3d as o3d
+    from normalflow.utils import transform2pose
+
+    # Read the configuration
+    config = load_sensor_profile(args.config_path)
+    parent_dir = args.parent_dir
+    gradient_maps = np.load(os.path.join(parent_dir, "gradient_maps.npy"))
+    contact_masks = np.load(os.path.join(parent_dir, "contact_masks.npy"))
+    check_frame_size(gradient_maps, config["imgh"], config["imgw"])
+    gradient_maps, contact_masks, ppmm = downscale(
+        gradient_maps, contact_masks, config["ppmm"], config["downscale"]
+    )
+
+    # Track in both precisions with the same random seeds (sampling and RANSAC)
+    precision_start_T_currs = {}
+    for dtype in [np.float64, np.float32]:
+        np.random.seed(0)
+        o3d.utility.random.seed(0)
+        precision_start_T_currs[dtype] = track_poses(
+            gradient_maps, contact_masks, args.method, ppmm, dtype
+        )
+
+    # Compare the estimated poses
+    pose_drifts = np.array(
+        [
+            np.abs(transform2pose(start_T_curr_32) - transform2pose(start_T_curr_64))
+            for start_T_curr_64, start_T_curr_32 in zip(
+                precision_start_T_currs[np.float64],
+                precision_start_T_currs[np.float32],
+            )
+        ]
+    )
+    trans_drift = np.max(pose_drifts[:, :3])
+    rot_drift = np.max(pose_drifts[:, 3:])
+    print(
+        "float32 drift of %s method for data in %s: %.5f mm, %.5f degree"
+        % (args.method, parent_dir, trans_drift, rot_drift)
+    )
+    if trans_drift > args.trans_tol or rot_drift > args.rot_tol:
+        raise SystemExit(
+            "float32 drift exceeds the tolerance (%.5f mm, %.5f degree)"
+            % (args.trans_tol, args.rot_tol)
+        )
+
+
+if __name__ == "__main__":
+    check_precision()
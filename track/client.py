@@ -0,0 +1,122 @@
+import argparse
+import json
+import os
+import socket
+import sys
+
+"""
+This script submits tracking jobs to a running tracking server and streams back its replies.
+It only imports the standard library, so it starts fast.
+
+Usage:
+    python client.py [--socket SOCKET_PATH] [--parent_dirs PARENT_DIR ...] [--config_path CONFIG_PATH] [--method METHOD {nf, icp, filterreg, fpfh}] [--threads THREADS] [--precision {float64, float32}] [--downscale DOWNSCALE]
+
+Arguments:
+    --socket: The Unix socket the tracking server listens on.
+    --parent_dirs: The directories where the data of the trials are stored.
+    --config_path: (Optional) The path of the configuration file for the GelSight sensor.
+            The default is the configuration the server defaults to (GelSight Mini).
+    --method: (Optional) The method to track the object poses.
+            The default is 'nf', representing the normal flow method.
+    --threads, --precision, --downscale: (Optional) Same as the arguments of track.
+
+The replies of the server are printed as JSON lines. The client exits with an error if any
+of the jobs failed.
+"""
+
+
+def track_client():
+    # Argument Parser
+    parser = argparse.ArgumentParser(description="Submit tracking jobs to a server.")
+    parser.add_argument(
+        "-s",
+        "--socket",
+        type=str,
+        required=True,
+        help="path of the Unix socket the tracking server listens on",
+    )
+    parser.add_argument(
+        "-p",
+        "--parent_dirs",
+        type=str,
+        nargs="+",
+        required=True,
+        help="paths of the trial data",
+    )
+    parser.add_argument(
+        "-c",
+        "--config_path",
+        type=str,
+        default=None,
+        help="path to the sensor configuration file",
+    )
+    parser.add_argument(
+        "-m",
+        "--method",
+        type=str,
+        default="nf",
+        choices=["nf", "icp", "filterreg", "fpfh"],
+        help="Registration method",
+    )
+    parser.add_argument(
+        "-t",
+        "--threads",
+        type=int,
+        default=None,
+        help="number of threads used by numpy, scipy FFT, and Open3D",
+    )
+    parser.add_argument(
+        "--precision",
+        type=str,
+        default=None,
+        choices=["float64", "float32"],
+        help="precision of the ICP point clouds",
+    )
+    parser.add_argument(
+        "--downscale",
+        type=int,
+        default=None,
+        help="integer factor to downscale the frames by before tracking",
+    )
+    args = parser.parse_args()
+
+    # Create the jobs, leaving out the options to use the server defaults
+    jobs = []
+    for job_id, parent_dir in enumerate(args.parent_dirs):
+        job = {
+            "id": job_id,
+            "parent_dir": os.path.realpath(parent_dir),
+            "method": args.method,
+        }
+        if args.config_path is not None:
+            job["config_path"] = os.path.realpath(args.config_path)
+        for key in ["threads", "precision", "downscale"]:
+            if getattr(args, key) is not None:
+                job[key] = getattr(args, key)
+        jobs.append(job)
+
+    # Submit the jobs and stream back the replies until all jobs are finished
+    n_failed = 0
+    n_finished = 0
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as sock:
+        sock.connect(args.socket)
+        sock.sendall("".join(json.dumps(job) + "\n" for job in jobs).encode())
+        sock.shutdown(socket.SHUT_WR)
+        with sock.makefile("r") as f:
+            for line in f:
+                print(line, end="", flush=True)
+                message = json.loads(line)
+                if message["status"] == "error":
+                    n_failed += 1
+                if message["status"] in ["done", "error"]:
+                    n_finished += 1
+                if n_finished == len(jobs):
+                    break
+    # The jobs without a reply were dropped by the server
+    n_failed += len(jobs) - n_finished
+    if n_failed > 0:
+        sys.exit("%d of %d tracking jobs failed" % (n_failed, len(jobs)))
+
+
+if __name__ == "__main__":
+    track_client()
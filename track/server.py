@@ -0,0 +1,235 @@
+import argparse
+import json
+import os
+import socket
+import socketserver
+import stat
+import sys
+import time
+
+import numpy as np
+
+from baselines.sensor_profile import load_sensor_profile
+from track.track import load_backends, track_trial
+
+"""
+This script runs a long-lived tracking worker that keeps the tracking modules imported and
+the sensor profiles cached, so that many short trials are not dominated by start-up time.
+
+The worker reads tracking jobs as JSON lines, either from stdin or from the clients of a
+Unix socket, and runs them one at a time. Each job is a JSON object with the keys:
+    - parent_dir: The directory where the trial data are stored.
+    - method: (Optional) The tracking method {nf, icp, filterreg, fpfh}. The default is 'nf'.
+    - config_path: (Optional) The path of the sensor configuration file.
+            The default is GelSight Mini configuration.
+    - threads, precision, downscale: (Optional) Same as the arguments of track.
+    - id: (Optional) An identifier echoed back in every reply.
+
+For each job, the worker replies with JSON lines whose 'status' is:
+    - progress: with 'frame' and 'n_frames', every --progress_interval frames.
+    - done: with 'save_path' and 'time', the tracking time in seconds.
+    - error: with 'error', the error message. The worker keeps serving the next jobs.
+
+Usage:
+    python server.py [--socket SOCKET_PATH] [--threads THREADS] [--progress_interval INTERVAL]
+
+Arguments:
+    --socket: (Optional) The Unix socket to listen on. If not given, serve stdin and stdout.
+            A stale socket left at the path is replaced; any other file is left untouched.
+    --threads: (Optional) The default number of threads for jobs that do not specify it.
+    --progress_interval: (Optional) The number of frames between progress replies.
+            The default is 10.
+"""
+
+config_path = os.path.join(os.path.dirname(__file__), "../configs/gsmini.yaml")
+
+
+class TrackWorker:
+    """
+    Runs the tracking jobs and keeps the loaded sensor profiles between jobs.
+    """
+
+    def __init__(self, threads=None, progress_interval=10):
+        """
+        :param threads: int; the default number of threads for jobs that do not specify it.
+        :param progress_interval: int; the number of frames between progress replies.
+        """
+        self.threads = threads
+        self.progress_interval = progress_interval
+        self.configs = {}
+
+    def serve(self, lines, reply):
+        """
+        Run the jobs in the JSON lines one at a time.
+
+        :param lines: iterable of str; the JSON lines of the jobs.
+        :param reply: callable; called with each reply dictionary.
+        """
+        for line in lines:
+            if line.strip() == "":
+                continue
+            try:
+                job = json.loads(line)
+            except json.JSONDecodeError as e:
+                reply({"status": "error", "error": "Invalid job: %s" % e})
+                continue
+            if not isinstance(job, dict):
+                reply({"status": "error", "error": "Job is not a JSON object"})
+                continue
+            self.run(job, reply)
+
+    def run(self, job, reply):
+        """
+        Run a tracking job, replying its progress and result.
+
+        :param job: dict; the tracking job.
+        :param reply: callable; called with each reply dictionary.
+        """
+        job_id = job.get("id")
+        try:
+            parent_dir = job["parent_dir"]
+            method = job.get("method", "nf")
+            config = self.load_config(job.get("config_path", config_path))
+            threads = job.get("threads", config["threads"])
+            if threads is None:
+                threads = self.threads
+            precision = job.get("precision", "float64")
+            if precision not in ["float64", "float32"]:
+                raise ValueError(
+                    "Invalid precision %s, expected float64 or float32" % precision
+                )
+
+            def progress(frame, n_frames):
+                if frame % self.progress_interval == 0 or frame == n_frames:
+                    reply(
+                        {
+                            "id": job_id,
+                            "status": "progress",
+                            "frame": frame,
+                            "n_frames": n_frames,
+                        }
+                    )
+
+            start_time = time.time()
+            track_trial(
+                parent_dir,
+                method,
+                config["ppmm"],
+                (config["imgh"], config["imgw"]),
+                threads,
+                np.dtype(precision),
+                job.get("downscale", config["downscale"]),
+                progress,
+            )
+        except Exception as e:
+            reply({"id": job_id, "status": "error", "error": repr(e)})
+            return
+        save_path = os.path.join(parent_dir, "%s_start_T_currs.npy" % (method))
+        reply(
+            {
+                "id": job_id,
+                "status": "done",
+                "save_path": save_path,
+                "time": time.time() - start_time,
+            }
+        )
+
+    def load_config(self, config_path):
+        """
+        Load the sensor profile, reusing the cached one if it was loaded before.
+
+        :param config_path: str; the path of the configuration file.
+        :return: dict; the sensor profile.
+        """
+        config_path = os.path.realpath(config_path)
+        if config_path not in self.configs:
+            self.configs[config_path] = load_sensor_profile(config_path)
+        return self.configs[config_path]
+
+
+class TrackRequestHandler(socketserver.StreamRequestHandler):
+    """
+    Serves the jobs sent by a client of the Unix socket.
+    """
+
+    def handle(self):
+        def reply(message):
+            self.wfile.write((json.dumps(message) + "\n").encode())
+            self.wfile.flush()
+
+        lines = (line.decode() for line in self.rfile)
+        self.server.worker.serve(lines, reply)
+
+
+def track_server():
+    # Argument Parser
+    parser = argparse.ArgumentParser(description="Serve tracking jobs.")
+    parser.add_argument(
+        "-s",
+        "--socket",
+        type=str,
+        default=None,
+        help="path of the Unix socket to listen on, serve stdin if not given",
+    )
+    parser.add_argument(
+        "-t",
+        "--threads",
+        type=int,
+        default=None,
+        help="default number of threads used by numpy, scipy FFT, and Open3D",
+    )
+    parser.add_argument(
+        "--progress_interval",
+        type=int,
+        default=10,
+        help="number of frames between progress replies",
+    )
+    args = parser.parse_args()
+    # Import the tracking backends once, so that no job pays for them
+    load_backends()
+    worker = TrackWorker(args.threads, args.progress_interval)
+
+    if args.socket is None:
+        # Serve the jobs from stdin
+        def reply(message):
+            sys.stdout.write(json.dumps(message) + "\n")
+            sys.stdout.flush()
+
+        worker.serve(sys.stdin, reply)
+        return
+
+    # Serve the jobs from the clients of the Unix socket, one client at a time
+    if os.path.exists(args.socket):
+        if not stat.S_ISSOCK(os.stat(args.socket).st_mode):
+            sys.exit("%s exists and is not a socket" % args.socket)
+        if _is_socket_live(args.socket):
+            sys.exit("Another server is already listening on %s" % args.socket)
+        os.remove(args.socket)
+    with socketserver.UnixStreamServer(args.socket, TrackRequestHandler) as server:
+        server.worker = worker
+        print("Tracking server listening on %s" % args.socket, file=sys.stderr)
+        try:
+            server.serve_forever()
+        except KeyboardInterrupt:
+            pass
+        finally:
+            os.remove(args.socket)
+
+
+def _is_socket_live(socket_path):
+    """
+    Check whether a server is listening on the Unix socket.
+
+    :param socket_path: str; the path of the Unix socket.
+    :return: bool; False if the socket is stale, i.e. its connections are refused.
+    """
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as sock:
+        try:
+            sock.connect(socket_path)
+        except ConnectionRefusedError:
+            return False
+    return True
+
+
+if __name__ == "__main__":
+    track_server()
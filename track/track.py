@@ -2,19 +2,16 @@ import argparse
 import os
 
 import numpy as np
-import yaml
 
-from baselines.registration import fpfh, icp, filterreg
-from gs_sdk.gs_reconstruct import poisson_dct_neumaan
-from normalflow.registration import normalflow, InsufficientOverlapError
-from normalflow.utils import gxy2normal, erode_contact_mask
+from baselines.parallel import thread_limits
+from baselines.sensor_profile import check_frame_size, downscale, load_sensor_profile
 
 """
 This script demonstrates tracking the object poses using different methods.
 Users can choose the following methods: normalflow, icp, filterreg, fpfh.
 
 Usage:
-    python track.py [--parent_dir PARENT_DIR] [--config_path CONFIG_PATH] [--method METHOD {nf, icp, filterreg, fpfh}]
+    python track.py [--parent_dir PARENT_DIR] [--config_path CONFIG_PATH] [--method METHOD {nf, icp, filterreg, fpfh}] [--threads THREADS] [--precision {float64, float32}] [--downscale DOWNSCALE]
 
 Arguments:
     --parent_dir: The directory where the data are stored.
@@ -23,6 +20,16 @@ Arguments:
             The default is GelSight Mini configuration.
     --method: (Optional) The method to track the object poses.
             The default is 'nf', representing the normal flow method.
+    --threads: (Optional) The number of threads used by numpy, scipy FFT, and Open3D.
+            Overrides the 'threads' entry of the configuration file if given.
+            The default uses the library defaults: one thread per core for numpy and Open3D,
+            and a single scipy FFT worker. The budget also lets the FFT use up to THREADS workers.
+    --precision: (Optional) The floating point precision of the point clouds of ICP.
+            Only the 'icp' method supports 'float32'. The poses are always accumulated in float64.
+            The default is 'float64'.
+    --downscale: (Optional) The integer factor to downscale the frames by before tracking.
+            Overrides the 'downscale' entry of the configuration file if given.
+            The default is 1, meaning no downscaling.
 
 Before running, the required dataset needs to have:
     - contact_masks.npy: The contact masks of the frames.
@@ -30,6 +37,9 @@ Before running, the required dataset needs to have:
 
 After running, the dataset will additionally includes:
     - {method}_start_T_currs.npy: The estimated transformation matrices of the object poses.
+
+The tracking backends (NormalFlow, Open3D, probreg, gs_sdk) are imported on first use, and
+only the ones the selected method needs, to keep the start-up fast.
 """
 
 config_path = os.path.join(os.path.dirname(__file__), "../configs/gsmini.yaml")
@@ -59,21 +69,127 @@ def track():
         choices=["nf", "icp", "filterreg", "fpfh"],
         help="Registration method",
     )
+    parser.add_argument(
+        "-t",
+        "--threads",
+        type=int,
+        default=None,
+        help="number of threads used by numpy and Open3D, also the scipy FFT workers",
+    )
+    parser.add_argument(
+        "--precision",
+        type=str,
+        default="float64",
+        choices=["float64", "float32"],
+        help="precision of the ICP point clouds, float32 supports icp only",
+    )
+    parser.add_argument(
+        "--downscale",
+        type=int,
+        default=None,
+        help="integer factor to downscale the frames by before tracking",
+    )
     args = parser.parse_args()
 
     # Read the configuration
-    with open(args.config_path, "r") as f:
-        config = yaml.safe_load(f)
-        ppmm = config["ppmm"]
-    # Load the initial frame
-    parent_dir = args.parent_dir
+    config = load_sensor_profile(args.config_path)
+    ppmm = config["ppmm"]
+    threads = config["threads"] if args.threads is None else args.threads
+    factor = config["downscale"] if args.downscale is None else args.downscale
+    track_trial(
+        args.parent_dir,
+        args.method,
+        ppmm,
+        (config["imgh"], config["imgw"]),
+        threads,
+        np.dtype(args.precision),
+        factor,
+    )
+    print(
+        "Object pose tracked with %s method for data in %s"
+        % (args.method, args.parent_dir)
+    )
+
+
+def track_trial(
+    parent_dir,
+    method="nf",
+    ppmm=0.0634,
+    imgsize=(240, 320),
+    num_threads=None,
+    dtype=np.float64,
+    downscale_factor=1,
+    progress=None,
+):
+    """
+    Track the object poses in a trial and save the estimated transformations.
+
+    :param parent_dir: str; the directory where the trial data are stored.
+    :param method: str; the tracking method, one of 'nf', 'icp', 'filterreg', 'fpfh'.
+    :param ppmm: float; pixel per millimeter.
+    :param imgsize: tuple of int; the (height, width) of the frames the sensor profile expects.
+    :param num_threads: int; the number of threads for numpy, scipy FFT, and Open3D.
+        If None, use the library defaults.
+    :param dtype: np.dtype; the precision of the ICP point clouds, see track_poses.
+    :param downscale_factor: int; the factor to downscale the frames by before tracking.
+    :param progress: callable; called with the number of tracked frames and the total
+        number of frames after each frame. If None, no progress is reported.
+    :return: np.ndarray (N, 4, 4); the estimated transformations from each frame to the start frame.
+    """
     gradient_maps = np.load(os.path.join(parent_dir, "gradient_maps.npy"))
     contact_masks = np.load(os.path.join(parent_dir, "contact_masks.npy"))
-    G_ref = gradient_maps[0].astype(np.float32)
-    C_ref = contact_masks[0]
-    C_ref = erode_contact_mask(C_ref)
-    H_ref = poisson_dct_neumaan(G_ref[:, :, 0], G_ref[:, :, 1]).astype(np.float32)
-    N_ref = gxy2normal(G_ref)
+    check_frame_size(gradient_maps, *imgsize)
+    gradient_maps, contact_masks, ppmm = downscale(
+        gradient_maps, contact_masks, ppmm, downscale_factor
+    )
+    # Load the backend first, since the thread limits only apply to loaded libraries
+    load_backends((method,))
+    with thread_limits(num_threads):
+        est_start_T_currs = track_poses(
+            gradient_maps, contact_masks, method, ppmm, dtype, progress
+        )
+    save_path = os.path.join(parent_dir, "%s_start_T_currs.npy" % (method))
+    np.save(save_path, est_start_T_currs)
+    return est_start_T_currs
+
+
+def track_poses(
+    gradient_maps,
+    contact_masks,
+    method="nf",
+    ppmm=0.0634,
+    dtype=np.float64,
+    progress=None,
+):
+    """
+    Track the object poses given the gradient maps and contact masks of a trial.
+
+    :param gradient_maps: np.ndarray (N, H, W, 2); the gradient maps of the frames.
+    :param contact_masks: np.ndarray (N, H, W); the contact masks of the frames.
+    :param method: str; the tracking method, one of 'nf', 'icp', 'filterreg', 'fpfh'.
+    :param ppmm: float; pixel per millimeter.
+    :param dtype: np.dtype; the precision of the ICP point clouds. np.float32 is only supported
+        by the 'icp' method. The transformations are always accumulated in float64.
+    :param progress: callable; called with the number of tracked frames and the total
+        number of frames after each frame. If None, no progress is reported.
+    :return: np.ndarray (N, 4, 4); the estimated transformations from each frame to the start frame.
+    """
+    if dtype not in [np.float64, np.float32]:
+        raise ValueError(
+            "Invalid precision %s, expected float64 or float32" % np.dtype(dtype).name
+        )
+    # Import the backend of the method only
+    if method == "nf":
+        from normalflow.registration import normalflow, InsufficientOverlapError
+    elif method in ["icp", "filterreg", "fpfh"]:
+        from baselines.registration import fpfh, icp, filterreg
+    else:
+        raise ValueError("Invalid tracking method %s" % method)
+    if dtype != np.float64 and method != "icp":
+        raise ValueError("Method %s only supports float64 precision" % method)
+
+    # Load the initial frame
+    N_ref, C_ref, H_ref = _surface(gradient_maps[0], contact_masks[0])
 
     # Track the sensor transformation relative to the reference frame
     curr_T_ref_init = np.eye(4)
@@ -81,13 +197,8 @@ def track():
     est_start_T_currs = [np.eye(4)]
     for G_curr, C_curr in zip(gradient_maps[1:], contact_masks[1:]):
         # Load and compute the surface information of the target frame
-        G_curr = G_curr.astype(np.float32)
-        C_curr = erode_contact_mask(C_curr)
-        H_curr = poisson_dct_neumaan(G_curr[:, :, 0], G_curr[:, :, 1]).astype(
-            np.float32
-        )
-        N_curr = gxy2normal(G_curr)
-        if args.method == "nf":
+        N_curr, C_curr, H_curr = _surface(G_curr, C_curr)
+        if method == "nf":
             try:
                 curr_T_ref = normalflow(
                     N_ref,
@@ -101,27 +212,81 @@ def track():
                 )
             except InsufficientOverlapError:
                 curr_T_ref = curr_T_ref_init
-        elif args.method == "icp":
+        elif method == "icp":
             curr_T_ref = icp(
-                N_ref, C_ref, H_ref, N_curr, C_curr, H_curr, curr_T_ref_init, ppmm
+                N_ref,
+                C_ref,
+                H_ref,
+                N_curr,
+                C_curr,
+                H_curr,
+                curr_T_ref_init,
+                ppmm,
+                dtype=dtype,
             )
-        elif args.method == "filterreg":
+        elif method == "filterreg":
             curr_T_ref = filterreg(
-                C_ref, H_ref, N_curr, C_curr, H_curr, curr_T_ref_init, ppmm
+                C_ref,
+                H_ref,
+                N_curr,
+                C_curr,
+                H_curr,
+                curr_T_ref_init,
+                ppmm,
             )
-        elif args.method == "fpfh":
+        elif method == "fpfh":
             curr_T_ref = fpfh(
-                N_ref, C_ref, H_ref, N_curr, C_curr, H_curr, curr_T_ref_init, ppmm
+                N_ref,
+                C_ref,
+                H_ref,
+                N_curr,
+                C_curr,
+                H_curr,
+                curr_T_ref_init,
+                ppmm,
             )
-        else:
-            raise ValueError("Invalid tracking method %s" % args.method)
         curr_T_ref_init = curr_T_ref
         est_start_T_currs.append(np.linalg.inv(curr_T_ref))
-    save_path = os.path.join(parent_dir, "%s_start_T_currs.npy" % (args.method))
-    np.save(save_path, np.array(est_start_T_currs))
-    print(
-        "Object pose tracked with %s method for data in %s" % (args.method, parent_dir)
-    )
+        if progress is not None:
+            progress(len(est_start_T_currs), len(gradient_maps))
+    return np.array(est_start_T_currs)
+
+
+def _surface(G, C):
+    """
+    Compute the normal map, eroded contact mask, and height map of a frame.
+
+    :param G: np.ndarray (H, W, 2); the gradient map of the frame.
+    :param C: np.ndarray (H, W); the contact mask of the frame.
+    :return: tuple of np.ndarray; the normal map, contact mask, and height map.
+    """
+    from gs_sdk.gs_reconstruct import poisson_dct_neumaan
+    from normalflow.utils import gxy2normal, erode_contact_mask
+
+    G = G.astype(np.float32)
+    C = erode_contact_mask(C)
+    H = poisson_dct_neumaan(G[:, :, 0], G[:, :, 1]).astype(np.float32)
+    N = gxy2normal(G)
+    return N, C, H
+
+
+def load_backends(methods=("nf", "icp", "filterreg", "fpfh")):
+    """
+    Import the tracking backends of the methods ahead of their first use.
+    Long-lived processes call this to pay the import time once, at start-up.
+
+    :param methods: tuple of str; the tracking methods to import the backends of.
+    """
+    import gs_sdk.gs_reconstruct
+    import normalflow.utils
+
+    if "nf" in methods:
+        import normalflow.registration
+    if "icp" in methods or "fpfh" in methods:
+        import baselines.registration
+    if "filterreg" in methods:
+        import baselines.registration
+        import probreg
 
 
 if __name__ == "__main__":
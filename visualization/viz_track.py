@@ -1,12 +1,9 @@
 import argparse
 import os
 
-import cv2
 import numpy as np
 import yaml
 
-from normalflow.viz_utils import annotate_coordinate_system
-
 """
 This script visualize the tracking results by creating a tracking video.
 
@@ -61,6 +58,9 @@ def viz_track():
         help="Registration method",
     )
     args = parser.parse_args()
+    # Import OpenCV after parsing the arguments to keep the start-up fast
+    import cv2
+    from normalflow.viz_utils import annotate_coordinate_system
 
     # Read the configuration
     with open(args.config_path, "r") as f:
@@ -1,13 +1,8 @@
 import argparse
 import os
 
-import matplotlib.pyplot as plt
-import matplotlib.patches as mpatches
-from matplotlib.gridspec import GridSpec
 import numpy as np
 
-from normalflow.utils import transform2pose
-
 """
 This script compares the tracking results of different methods for each object.
 With the dataset that comes with the paper, the script can generate the comparison 
@@ -45,6 +40,11 @@ def viz_track_result():
         help="path to the tracking dataset",
     )
     args = parser.parse_args()
+    # Import matplotlib after parsing the arguments to keep the start-up fast
+    import matplotlib.pyplot as plt
+    import matplotlib.patches as mpatches
+    from matplotlib.gridspec import GridSpec
+    from normalflow.utils import transform2pose
 
     # Plotting parameters
     parent_dir = args.parent_dir